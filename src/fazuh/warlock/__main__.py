@@ -6,11 +6,20 @@ requested module (track, war, or autofill).
 
 import argparse
 import asyncio
+import importlib
 
 from loguru import logger
 
+from fazuh.warlock.bot import init_discord_bot
 from fazuh.warlock.config import Config
 
+# Module name -> (import path, class). Only the selected module is imported at startup.
+_MODULES = {
+    "track": ("fazuh.warlock.module.track", "Track"),
+    "war": ("fazuh.warlock.module.war_bot", "WarBot"),
+    "autofill": ("fazuh.warlock.module.auto_fill", "AutoFill"),
+}
+
 
 async def main():
     """Async entry point.
@@ -21,7 +30,7 @@ async def main():
     parser = argparse.ArgumentParser(description="Warlock Bot")
     parser.add_argument(
         "module",
-        choices=["track", "war", "autofill"],
+        choices=list(_MODULES),
         help="Module to run (track, war, or autofill).",
     )
     args = parser.parse_args()
@@ -31,33 +40,30 @@ async def main():
     # singleton init
     Config().load()
 
-    from fazuh.warlock.bot import init_discord_bot
-
     # NOTE: Early async bot initialization. on_ready state will be awaited when needed.
-    init_discord_bot()
+    # Modules that never solve CAPTCHAs skip it; the bot starts lazily if one is ever needed.
+    init_discord_bot(require_captcha=args.module in ("war", "autofill"))
 
     try:
-        if args.module == "track":
-            from fazuh.warlock.module.track import Track
-
-            await Track().start()
-
-        elif args.module == "war":
-            from fazuh.warlock.module.war_bot import WarBot
-
-            await WarBot().start()
-
-        elif args.module == "autofill":
-            from fazuh.warlock.module.auto_fill import AutoFill
-
-            await AutoFill().start()
+        module_path, class_name = _MODULES[args.module]
+        module_cls = getattr(importlib.import_module(module_path), class_name)
+        await module_cls().start()
     except Exception as e:
         logger.error(e)
 
 
 def main_sync():
-    """Synchronous wrapper for the async main function."""
-    asyncio.run(main())
+    """Synchronous wrapper for the async main function.
+
+    Runs on uvloop when it is available (it is not supported on Windows), and falls
+    back to the default asyncio event loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 if __name__ == "__main__":
@@ -1,175 +1,74 @@
+"""Lazily-initialized Discord CAPTCHA bot singleton.
+
+The Discord SDK is only imported when the bot is started or `CaptchaBot` is
+accessed, so importing this module stays cheap for modules that never solve
+a CAPTCHA.
+"""
+
 import asyncio
-import io
+from typing import TYPE_CHECKING
 
-import discord
-from discord.abc import Messageable
 from loguru import logger
 
 from fazuh.warlock.config import Config
 
+if TYPE_CHECKING:
+    from fazuh.warlock.captcha_bot import CaptchaBot
 
-class CaptchaBot(discord.Client):
-    """Discord bot for handling CAPTCHA challenges.
-
-    This bot sends CAPTCHA images to a specified Discord channel and waits for
-    a user to reply with the solution. It facilitates manual CAPTCHA solving
-    for the automated browser session.
-    """
-
-    def __init__(self, channel_id: int):
-        intents = discord.Intents.default()
-        intents.messages = True
-        intents.message_content = True
-        super().__init__(intents=intents)
-
-        self.channel_id = channel_id
-        self.pending_captchas: dict[int, asyncio.Future] = {}
-        self._ready_event = asyncio.Event()
-        self.latest_captcha_message_id: int | None = None
-
-    async def on_ready(self):
-        """Called when the bot has successfully connected to Discord."""
-        logger.info(f"CaptchaBot logged in as {self.user}")
-        self._ready_event.set()
-
-    async def on_message(self, message: discord.Message):
-        """Handles incoming messages.
-
-        Checks if a message is a reply to a pending CAPTCHA request. If so,
-        it extracts the solution and resolves the corresponding future.
-        """
-        if message.author == self.user:
-            return
-
-        bot_message_id = await self._identify_captcha_request(message)
-
-        if bot_message_id:
-            await self._handle_solution(message, bot_message_id)
-
-    async def _identify_captcha_request(self, message: discord.Message) -> int | None:
-        """Identifies if a message is a solution to a pending captcha."""
-        # 1. Check direct reply
-        if message.reference and message.reference.message_id in self.pending_captchas:
-            return message.reference.message_id
-
-        # 2. Check fallback (6 chars, correct channel, user message)
-        if (
-            message.channel.id == self.channel_id
-            and len(message.content.strip()) == 6
-            and not message.author.bot
-            and self.pending_captchas
-            and self.latest_captcha_message_id
-        ):
-            # Verify it's immediately after the latest captcha
-            if await self._is_immediately_after_captcha(message):
-                return self.latest_captcha_message_id
-
-        return None
-
-    async def _is_immediately_after_captcha(self, message: discord.Message) -> bool:
-        """Checks if the message is immediately after the latest captcha message."""
-        try:
-            # Get history limit=2 (current message + previous one)
-            messages = [msg async for msg in message.channel.history(limit=2)]
 
-            if len(messages) < 2:
-                return False
+def __getattr__(name: str):
+    if name == "CaptchaBot":
+        from fazuh.warlock.captcha_bot import CaptchaBot
 
-            # messages[0] is the current message (the solution candidate)
-            # messages[1] should be the captcha message
-            previous_message = messages[1]
+        return CaptchaBot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-            return previous_message.id == self.latest_captcha_message_id
 
-        except Exception as e:
-            logger.error(f"Failed to check message history: {e}")
-            return False
-
-    async def _handle_solution(self, message: discord.Message, bot_message_id: int):
-        """Processes the solution message."""
-        future = self.pending_captchas.get(bot_message_id)
-        if future and not future.done():
-            solution = message.content.strip()
-            logger.info(f"Received CAPTCHA solution from {message.author}")
-            future.set_result(solution)
-
-            try:
-                channel = message.channel
-                bot_message = await channel.fetch_message(bot_message_id)
-                await bot_message.add_reaction("✅")
-            except Exception as e:
-                logger.error(f"Failed to add reaction to bot message: {e}")
-
-    async def solve(self, image_data: bytes) -> str | None:
-        """Sends a CAPTCHA image to Discord and waits for a solution."""
-        await self._ready_event.wait()
-
-        channel = self.get_channel(self.channel_id)
-        if not channel:
-            try:
-                channel = await self.fetch_channel(self.channel_id)
-            except Exception:
-                pass
-
-        if not channel or not isinstance(channel, Messageable):
-            logger.error(f"Channel {self.channel_id} not found or not messageable.")
-            return None
+class _BotState:
+    """Global singleton state for the CAPTCHA bot."""
 
-        try:
-            file = discord.File(io.BytesIO(image_data), filename="captcha.png")
-            message = await channel.send(
-                content="CAPTCHA detected. Please **reply** to this message with the solution code.",
-                file=file,
-            )
-
-            loop = asyncio.get_running_loop()
-            future = loop.create_future()
-            self.pending_captchas[message.id] = future
-            self.latest_captcha_message_id = message.id
-
-            try:
-                return await future
-            finally:
-                self.pending_captchas.pop(message.id, None)
-                if self.latest_captcha_message_id == message.id:
-                    self.latest_captcha_message_id = None
+    __slots__ = ("bot", "task", "attempted")
 
-        except Exception as e:
-            logger.error(f"Failed to solve CAPTCHA via Discord: {e}")
-            return None
+    def __init__(self):
+        self.bot: "CaptchaBot | None" = None
+        self.task: asyncio.Task | None = None
+        self.attempted: bool = False
 
 
-# Global Singleton state
-_bot: CaptchaBot | None = None
-_bot_task: asyncio.Task | None = None
-_initialization_attempted: bool = False
+_STATE = _BotState()
 
 
-def init_discord_bot():
+def init_discord_bot(require_captcha: bool = True):
     """Initializes the Discord bot if config is valid.
 
     Reads configuration from the global Config instance and starts the bot
     in a background task if the token and channel ID are present.
-    """
-    global _bot, _bot_task, _initialization_attempted
 
-    if _initialization_attempted:
+    Args:
+        require_captcha: Whether the caller needs CAPTCHA solving. If False, nothing is
+            started and a later `get_captcha_solution` call initializes the bot lazily.
+    """
+    state = _STATE
+    if not require_captcha or state.attempted:
         return
 
-    _initialization_attempted = True
+    state.attempted = True
     config = Config()
 
     token = config.discord_token
     channel_id = config.discord_channel_id
 
     if token and channel_id:
+        from fazuh.warlock.captcha_bot import CaptchaBot
+
         try:
-            _bot = CaptchaBot(int(channel_id))
-            _bot_task = asyncio.create_task(_bot.start(token))
+            state.bot = CaptchaBot(int(channel_id))
+            state.task = asyncio.create_task(state.bot.start(token))
+            state.task.add_done_callback(_on_bot_stopped)
             logger.info("Discord bot initialized in background.")
         except Exception as e:
             logger.error(f"Failed to initialize Discord bot: {e}")
-            _bot = None
+            state.bot = None
     elif token or channel_id:
         logger.warning(
             "Discord Bot configuration incomplete. Both DISCORD_TOKEN and DISCORD_CHANNEL_ID are required. Bot disabled."
@@ -180,6 +79,32 @@ def init_discord_bot():
         )
 
 
+def _on_bot_stopped(task: asyncio.Task):
+    """Disables the bot if its task exits with an error (e.g. a failed login)."""
+    if task.cancelled():
+        return
+
+    if e := task.exception():
+        logger.error(f"Discord bot stopped: {e}")
+        if _STATE.task is task:
+            _STATE.bot = None
+
+
+async def _wait_until_ready(bot: "CaptchaBot", task: asyncio.Task) -> bool:
+    """Waits for the bot to become ready, or for its task to exit first.
+
+    Returns:
+        bool: True if the bot is ready, False if it stopped before getting there.
+    """
+    ready = asyncio.ensure_future(bot.wait_for_channel())
+    done, _ = await asyncio.wait({ready, task}, return_when=asyncio.FIRST_COMPLETED)
+    if ready in done:
+        return True
+
+    ready.cancel()
+    return False
+
+
 async def get_captcha_solution(image_data: bytes) -> str | None:
     """Request a CAPTCHA solution via the Discord bot.
 
@@ -192,10 +117,15 @@ async def get_captcha_solution(image_data: bytes) -> str | None:
         str | None: The solution string, or None if the bot is not available.
     """
     # Ensure init was attempted
-    if not _initialization_attempted:
+    if not _STATE.attempted:
         init_discord_bot()
 
-    if not _bot:
+    bot, task = _STATE.bot, _STATE.task
+    if not bot or not task:
+        return None
+
+    # Return early rather than wait forever if the bot can't log in.
+    if not await _wait_until_ready(bot, task):
         return None
 
-    return await _bot.solve(image_data)
+    return await bot.solve(image_data)
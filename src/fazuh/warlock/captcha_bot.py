@@ -0,0 +1,168 @@
+"""Discord client used to relay CAPTCHA challenges to a human solver.
+
+Importing this module pulls in the Discord SDK. Prefer going through
+`fazuh.warlock.bot`, which only imports it once a bot is actually needed.
+"""
+
+import asyncio
+import io
+
+import discord
+from discord.abc import Messageable
+from loguru import logger
+
+_CAPTCHA_PROMPT = "CAPTCHA detected. Please **reply** to this message with the solution code."
+
+
+class CaptchaBot(discord.Client):
+    """Discord bot for handling CAPTCHA challenges.
+
+    This bot sends CAPTCHA images to a specified Discord channel and waits for
+    a user to reply with the solution. It facilitates manual CAPTCHA solving
+    for the automated browser session.
+    """
+
+    def __init__(self, channel_id: int):
+        intents = discord.Intents.default()
+        intents.messages = True
+        intents.message_content = True
+        super().__init__(intents=intents)
+
+        self.channel_id = channel_id
+        self._ready_event = asyncio.Event()
+        # Only one CAPTCHA is outstanding at a time; solve() holds the lock while waiting.
+        self._solve_lock = asyncio.Lock()
+        self._current_future: asyncio.Future[str] | None = None
+        self._current_message_id: int | None = None
+        self._channel: Messageable | None = None
+        self._user_id: int | None = None
+        # Set in on_ready, which runs on the bot's loop, so solve() needn't look it up each time.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # IDs of the two most recent messages seen in the CAPTCHA channel via the gateway.
+        self._last_message_id: int | None = None
+        self._previous_message_id: int | None = None
+        # Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight.
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def on_ready(self):
+        """Called when the bot has successfully connected to Discord."""
+        logger.info("CaptchaBot logged in as {}", self.user)
+        self._loop = asyncio.get_running_loop()
+        self._user_id = self.user.id if self.user else None
+        self._channel = await self._resolve_channel()
+        self._ready_event.set()
+
+    async def wait_for_channel(self):
+        """Waits until on_ready has run and the CAPTCHA channel has been resolved."""
+        await self._ready_event.wait()
+
+    async def _resolve_channel(self) -> Messageable | None:
+        """Looks up the CAPTCHA channel, falling back to the API if it is not cached."""
+        channel = self.get_channel(self.channel_id)
+        if not channel:
+            try:
+                channel = await self.fetch_channel(self.channel_id)
+            except discord.DiscordException as e:
+                logger.error("Failed to fetch channel {}: {}", self.channel_id, e)
+                return None
+
+        if not isinstance(channel, Messageable):
+            logger.error("Channel {} not found or not messageable.", self.channel_id)
+            return None
+
+        return channel
+
+    async def on_message(self, message: discord.Message):
+        """Handles incoming messages.
+
+        Checks if a message is a reply to a pending CAPTCHA request. If so,
+        it extracts the solution and resolves the corresponding future.
+        """
+        # Solutions are only ever posted in the CAPTCHA channel.
+        if message.channel.id != self.channel_id:
+            return
+
+        self._previous_message_id = self._last_message_id
+        self._last_message_id = message.id
+
+        if message.author.id == self._user_id:
+            return
+
+        bot_message_id = await self._identify_captcha_request(message)
+
+        if bot_message_id:
+            await self._handle_solution(message, bot_message_id)
+
+    async def _identify_captcha_request(self, message: discord.Message) -> int | None:
+        """Identifies if a message is a solution to a pending captcha."""
+        if self._current_future is None or self._current_message_id is None:
+            return None
+
+        # 1. Check direct reply
+        if message.reference and message.reference.message_id == self._current_message_id:
+            return self._current_message_id
+
+        # 2. Check fallback (6 chars, user message)
+        if len(message.content.strip()) == 6 and not message.author.bot:
+            # Verify it's immediately after the latest captcha
+            if self._is_immediately_after_captcha():
+                return self._current_message_id
+
+        return None
+
+    def _is_immediately_after_captcha(self) -> bool:
+        """Checks if the message is immediately after the latest captcha message."""
+        # Gateway events for a channel arrive in order, and the bot sees its own CAPTCHA
+        # message too, so the preceding message is already known without a history request.
+        return self._previous_message_id == self._current_message_id
+
+    async def _handle_solution(self, message: discord.Message, bot_message_id: int):
+        """Processes the solution message."""
+        future = self._current_future
+        if future and not future.done():
+            solution = message.content.strip()
+            logger.info("Received CAPTCHA solution from {}", message.author)
+            future.set_result(solution)
+
+            # The solver doesn't need to wait for the acknowledgement, so don't hold up the handler.
+            # A partial message is enough to react to and saves fetching the CAPTCHA message.
+            bot_message = message.channel.get_partial_message(bot_message_id)
+            task = asyncio.create_task(bot_message.add_reaction("✅"))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._on_acknowledged)
+
+    def _on_acknowledged(self, task: asyncio.Task):
+        """Releases a finished reaction task and logs it if it failed."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and (e := task.exception()):
+            logger.error("Failed to add reaction to bot message: {}", e)
+
+    async def solve(self, image_data: bytes) -> str | None:
+        """Sends a CAPTCHA image to Discord and waits for a solution."""
+        await self._ready_event.wait()
+
+        channel = self._channel
+        if channel is None:
+            logger.error("Channel {} not found or not messageable.", self.channel_id)
+            return None
+
+        async with self._solve_lock:
+            try:
+                message = await channel.send(
+                    content=_CAPTCHA_PROMPT,
+                    file=discord.File(io.BytesIO(image_data), filename="captcha.png"),
+                )
+
+                self._current_future = self._loop.create_future()
+                self._current_message_id = message.id
+                # Give the gateway a chance to run before parking on the future.
+                await asyncio.sleep(0)
+                return await self._current_future
+
+            except Exception as e:
+                logger.error("Failed to solve CAPTCHA via Discord: {}", e)
+                return None
+
+            finally:
+                self._current_future = None
+                self._current_message_id = None
@@ -3,7 +3,8 @@ from typing import Self
 
 from dotenv import load_dotenv
 from loguru import logger
-import requests
+
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
 
 
 class Config:
@@ -14,6 +15,26 @@ class Config:
     Discord integration.
     """
 
+    __slots__ = (
+        "user_id",
+        "auth_discord_webhook_url",
+        "discord_token",
+        "discord_channel_id",
+        "headless",
+        "browser",
+        "username",
+        "password",
+        "tracker_interval",
+        "tracker_max_interval",
+        "tracked_url",
+        "tracker_discord_webhook_url",
+        "tracker_suppress_professor_change",
+        "tracker_suppress_location_change",
+        "warbot_interval",
+        "warbot_autosubmit",
+        "warbot_notfound_retry",
+    )
+
     _instance: Self | None = None
 
     def load(self):
@@ -23,69 +44,74 @@ class Config:
         See .env-example for the required variables
         """
         load_dotenv()
-        username = os.getenv("USERNAME")
-        password = os.getenv("PASSWORD")
+        env = dict(os.environ)
+
+        username = env.get("USERNAME")
+        password = env.get("PASSWORD")
         if username is None or password is None:
             logger.error("USERNAME and PASSWORD environment variables are not set.")
             return
 
-        tracker_webhook = os.getenv("TRACKER_DISCORD_WEBHOOK_URL")
-        if tracker_webhook is None or not self._is_webhook_valid(tracker_webhook):
-            logger.error("Invalid TRACKER_DISCORD_WEBHOOK_URL.")
+        tracker_webhook = env.get("TRACKER_DISCORD_WEBHOOK_URL")
+        if tracker_webhook is None:
+            logger.error("TRACKER_DISCORD_WEBHOOK_URL environment variable is not set.")
             return
 
-        tracked_url = os.getenv("TRACKED_URL")
+        tracked_url = env.get("TRACKED_URL")
         if tracked_url is None:
             logger.error("TRACKED_URL environment variable is not set.")
             return
 
-        self.user_id = os.getenv("USER_ID")
-        self.auth_discord_webhook_url = os.getenv("AUTH_DISCORD_WEBHOOK_URL")
-        self.discord_token = os.getenv("DISCORD_TOKEN")
-        self.discord_channel_id = os.getenv("DISCORD_CHANNEL_ID")
+        self.user_id = env.get("USER_ID")
+        self.auth_discord_webhook_url = env.get("AUTH_DISCORD_WEBHOOK_URL")
+        self.discord_token = env.get("DISCORD_TOKEN")
+        self.discord_channel_id = env.get("DISCORD_CHANNEL_ID")
         if self.discord_channel_id:
             self.discord_channel_id = int(self.discord_channel_id)
-        self.headless = self._is_truthy(os.getenv("HEADLESS", "true"))
-        self.browser = os.getenv("BROWSER", "chromium").lower()
+        self.headless = self._is_truthy(env.get("HEADLESS", "true"))
+        self.browser = env.get("BROWSER", "chromium").lower()
 
         # SiakNG credentials
         self.username = username
         self.password = password
 
         # Schedule update tracker
-        self.tracker_interval = int(os.getenv("TRACKER_INTERVAL", 1200))
+        self.tracker_interval = self._parse_int(env, "TRACKER_INTERVAL", 1200)
+        # Defaults to TRACKER_INTERVAL, i.e. no backoff
+        self.tracker_max_interval = max(
+            self._parse_int(env, "TRACKER_MAX_INTERVAL", self.tracker_interval),
+            self.tracker_interval,
+        )
         self.tracked_url = tracked_url
         self.tracker_discord_webhook_url = tracker_webhook
         self.tracker_suppress_professor_change = self._is_truthy(
-            os.getenv("TRACKER_SUPPRESS_PROFESSOR_CHANGE", "false")
+            env.get("TRACKER_SUPPRESS_PROFESSOR_CHANGE", "false")
         )
         self.tracker_suppress_location_change = self._is_truthy(
-            os.getenv("TRACKER_SUPPRESS_LOCATION_CHANGE", "false")
+            env.get("TRACKER_SUPPRESS_LOCATION_CHANGE", "false")
         )
 
         # War bot
-        self.warbot_interval = int(os.getenv("WARBOT_INTERVAL", 5))
-        self.warbot_autosubmit = self._is_truthy(os.getenv("WARBOT_AUTOSUBMIT", "true"))
-        self.warbot_notfound_retry = self._is_truthy(os.getenv("WARBOT_NOTFOUND_RETRY", "true"))
+        self.warbot_interval = self._parse_int(env, "WARBOT_INTERVAL", 5)
+        self.warbot_autosubmit = self._is_truthy(env.get("WARBOT_AUTOSUBMIT", "true"))
+        self.warbot_notfound_retry = self._is_truthy(env.get("WARBOT_NOTFOUND_RETRY", "true"))
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(Config, cls).__new__(cls)
-
-            cls._instance.load()
         return cls._instance
 
     @staticmethod
-    def _is_webhook_valid(url: str) -> bool:
+    def _parse_int(env: dict[str, str], key: str, default: int) -> int:
+        value = env.get(key)
+        if not value:
+            return default
         try:
-            resp = requests.head(url, timeout=5)
-            return resp.status_code == 200
-        except requests.RequestException:
-            return False
-
-    def _is_truthy(self, bool_value: str) -> bool:
-        return bool_value.lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+            return int(value)
+        except ValueError:
+            logger.error(f"{key} must be an integer, got {value!r}. Using {default} instead.")
+            return default
+
+    @staticmethod
+    def _is_truthy(bool_value: str) -> bool:
+        return bool_value.lower() in _TRUTHY
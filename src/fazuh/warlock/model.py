@@ -5,15 +5,21 @@ and other domain objects, along with utilities for loading them from configurati
 """
 
 from dataclasses import dataclass
-import json
+from dataclasses import field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from loguru import logger
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CourseTarget:
     """Represents a target course for enrollment or monitoring.
 
@@ -31,35 +37,48 @@ class CourseTarget:
     time: Optional[str] = None
     name: Optional[str] = None
 
-    def matches(self, row_data: dict[str, str]) -> bool:
-        """
-        Checks if the provided row data matches this course target.
-        row_data must contain keys corresponding to the fields: 'name' (course name from UI), 'prof', 'code', 'time'.
-        """
+    # Matcher specialized for the fields this target sets, built once in __post_init__.
+    _match: Callable[[dict[str, str]], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so the derived field has to bypass __setattr__
+        object.__setattr__(self, "_match", self._compile())
+
+    def _compile(self) -> Callable[[dict[str, str]], bool]:
+        """Builds a matcher that only runs the checks this target needs, on lowercased values."""
         # 1. Match by Code (if provided, it is standalone or an override)
         if self.code:
-            if row_data.get("code", "").startswith(self.code):
-                return True
-            return False
+            code = self.code.lower()
+            return lambda row: row.get("code", "").startswith(code)
 
         # 2. Match by Course (Required if code is not provided)
         if not self.course:
-            return False
-
-        if self.course.lower() not in row_data.get("name", "").lower():
-            return False
-
-        # 3. Optional further filters: Professor
-        if self.prof:
-            if self.prof.lower() not in row_data.get("prof", "").lower():
-                return False
-
-        # 4. Optional further filters: Time
-        if self.time:
-            if self.time.lower() not in row_data.get("time", "").lower():
-                return False
-
-        return True
+            return lambda row: False
+
+        course = self.course.lower()
+
+        # 3. and 4. Optional further filters: Professor and Time
+        prof = (self.prof or "").lower()
+        time = (self.time or "").lower()
+        if prof and time:
+            return lambda row: (
+                course in row.get("name", "")
+                and prof in row.get("prof", "")
+                and time in row.get("time", "")
+            )
+        if prof:
+            return lambda row: course in row.get("name", "") and prof in row.get("prof", "")
+        if time:
+            return lambda row: course in row.get("name", "") and time in row.get("time", "")
+        return lambda row: course in row.get("name", "")
+
+    def matches(self, row_lc: dict[str, str]) -> bool:
+        """
+        Checks if the provided row data matches this course target.
+        row_lc must contain keys corresponding to the fields: 'name' (course name from UI), 'prof', 'code', 'time',
+        with every value already lowercased.
+        """
+        return self._match(row_lc)
 
     def __repr__(self):
         parts = []
@@ -76,26 +95,70 @@ class CourseTarget:
         return " ".join(parts)
 
 
+# Parsed course files keyed by resolved path, validated against (mtime_ns, size).
+_COURSE_CACHE: dict[str, tuple[int, int, list[CourseTarget]]] = {}
+
+
 def load_courses() -> list[CourseTarget]:
     yaml_path = Path("courses.yaml")
     json_path = Path("courses.json")
 
-    data = None
-
     if yaml_path.exists():
-        logger.info(f"Loading courses from {yaml_path}")
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        path = yaml_path
     elif json_path.exists():
-        logger.info(f"Loading courses from {json_path}")
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        path = json_path
     else:
         logger.error("No courses configuration file found (courses.yaml or courses.json).")
         raise FileNotFoundError("courses.yaml or courses.json not found.")
 
-    targets = []
+    st = path.stat()
+    key = str(path.resolve())
+    cached = _COURSE_CACHE.get(key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        targets = _parse_courses(path)
+        cached = _COURSE_CACHE[key] = (st.st_mtime_ns, st.st_size, targets)
+
+    # Targets are immutable, so only the list needs copying.
+    return list(cached[2])
 
+
+def _load_yaml(path: Path):
+    """Loads a YAML file, going through a JSON sidecar that is much faster to parse.
+
+    The sidecar (e.g. `.courses.yaml.json`) records the YAML file's (mtime_ns, size) and is only
+    used while both match exactly, so a YAML file restored with an older mtime is still picked up.
+    """
+    sidecar = path.with_name(f".{path.name}.json")
+    st = path.stat()
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        cached = orjson.loads(sidecar.read_bytes())
+        if isinstance(cached, dict) and cached.get("source") == source:
+            return cached["data"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable {sidecar}: {e}")
+
+    # LibYAML takes bytes, which skips a separate decode step.
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+    try:
+        sidecar.write_bytes(orjson.dumps({"source": source, "data": data}))
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write {sidecar}: {e}")
+
+    return data
+
+
+def _parse_courses(path: Path) -> list[CourseTarget]:
+    logger.info(f"Loading courses from {path}")
+    if path.suffix == ".yaml":
+        data = _load_yaml(path)
+    else:
+        data = orjson.loads(path.read_bytes())
+
+    targets = []
     # Handle Legacy Dict Format: {"CourseName": "ProfName"}
     if isinstance(data, dict):
         logger.info("Detected legacy dictionary format. Converting to CourseTarget objects.")
@@ -1,5 +1,3 @@
-import asyncio
-
 from loguru import logger
 
 from fazuh.warlock.config import Config
@@ -18,7 +16,6 @@ class AutoFill:
 
     def __init__(self):
         self.conf = Config()
-        self.conf.load()
         self.siak = Siak(self.conf)
         self.irs_service = IrsService(self.siak)
         self.courses = load_courses()
@@ -33,9 +30,8 @@ class AutoFill:
             await self._auth()
             await self._run()
 
-            # Keep browser open
-            while True:
-                await asyncio.sleep(1)
+            # Keep browser open until the user closes it (or presses Ctrl+C)
+            await self.siak.page.wait_for_event("close", timeout=0)
         except Exception as e:
             logger.error(f"An error occurred: {e}")
         finally:
@@ -50,7 +46,7 @@ class AutoFill:
         await self.irs_service.submit_irs(self.conf.warbot_autosubmit)
 
         logger.success("AutoFill completed successfully.")
-        logger.info("Script finished. Press Ctrl+C to exit (including the browser).")
+        logger.info("Script finished. Close the browser or press Ctrl+C to exit.")
 
     async def _auth(self):
         """Handles the authentication process.
@@ -64,11 +60,5 @@ class AutoFill:
         logger.info("Please authenticate manually in the browser window.")
         logger.info("Waiting for login and role selection...")
 
-        while True:
-            content = await self.siak.content
-            if await self.siak.is_logged_in_page(content) and await self.siak.is_role_selected(
-                content
-            ):
-                logger.info("Login and role selection detected!")
-                break
-            await asyncio.sleep(1)
+        await self.siak.wait_until_logged_in()
+        logger.info("Login and role selection detected!")
@@ -1,4 +1,5 @@
 import asyncio
+import os
 from pathlib import Path
 
 
@@ -7,6 +8,8 @@ class ScheduleCache:
 
     def __init__(self, file_path: str | Path = "data/latest_courses.txt"):
         self.file_path = Path(file_path)
+        # Last read content, validated against the file's (mtime_ns, size).
+        self._cache: tuple[int, int, str] | None = None
         self._ensure_directory()
 
     def _ensure_directory(self):
@@ -19,14 +22,45 @@ class ScheduleCache:
         return self.file_path.exists()
 
     def read(self) -> str:
-        """Reads the cache file content."""
-        if self.exists():
-            return self.file_path.read_text(encoding="utf-8")
-        return ""
+        """Reads the cache file content.
+
+        The content is kept in memory and only re-read when the file's mtime or size changes.
+        """
+        try:
+            st = self.file_path.stat()
+        except FileNotFoundError:
+            return ""
+
+        if self._cache is not None and self._cache[:2] == (st.st_mtime_ns, st.st_size):
+            return self._cache[2]
+
+        content = self.file_path.read_text(encoding="utf-8")
+        self._cache = (st.st_mtime_ns, st.st_size, content)
+        return content
 
     async def write(self, content: str):
         """Writes content to the cache file asynchronously."""
-        await asyncio.to_thread(self.file_path.write_text, content, encoding="utf-8")
+        await asyncio.to_thread(self._write, content)
+
+    def _write(self, content: str):
+        """Writes the cache file and remembers the content so the next read skips the disk.
+
+        The content goes to a temporary file that then replaces the cache file, so a crash
+        mid-write can't leave a truncated cache behind. Writing what the file already holds
+        is skipped.
+        """
+        if self.read() == content:
+            return
+
+        tmp_path = self.file_path.with_name(f"{self.file_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+
+        st = self.file_path.stat()
+        self._cache = (st.st_mtime_ns, st.st_size, content)
 
     def touch(self):
         """Creates the file if it doesn't exist."""
@@ -1,4 +1,6 @@
-from typing import Dict, List, Set, TypedDict
+import functools
+import sys
+from typing import Dict, List, Set, Tuple, TypedDict
 
 from loguru import logger
 
@@ -24,20 +26,53 @@ class ClassDetail(TypedDict):
 
 
 def parse_classes_by_name(classes: List[str]) -> Dict[str, ClassDetail]:
-    """Helper to parse class strings into structured dicts."""
+    """Helper to parse class strings into structured dicts.
+
+    Results are memoized, since most courses are unchanged between two schedule checks.
+    The returned dict is shared and must not be mutated.
+    """
+    return _parse_classes(tuple(classes))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_classes(classes: Tuple[str, ...]) -> Dict[str, ClassDetail]:
     result = {}
     for class_detail in classes:
-        parts = class_detail.split(";")
-        if len(parts) >= 5:
-            kelas = parts[0].replace("Kelas", "").strip()
-            result[kelas] = {
-                "waktu": parts[3].strip().lstrip("- "),
-                "ruang": parts[4].strip().lstrip("- "),
-                "dosen": parts[5].strip().lstrip("- ") if len(parts) > 5 else "-",
-            }
+        parsed = _parse_class(class_detail)
+        if parsed is not None:
+            kelas, detail = parsed
+            result[kelas] = detail
     return result
 
 
+def _trim_common_ends(old: List[str], new: List[str]) -> Tuple[List[str], List[str]]:
+    """Drops the longest common prefix and suffix shared by two lists."""
+    end = min(len(old), len(new))
+    head = 0
+    while head < end and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while tail < end - head and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+    return old[head : len(old) - tail], new[head : len(new) - tail]
+
+
+def _parse_class(class_detail: str) -> Tuple[str, ClassDetail] | None:
+    """Splits one class string into its name and details, or None if it is malformed."""
+    # Only the first six fields are used; leave anything after them unsplit
+    parts = class_detail.split(";", 6)
+    if len(parts) < 5:
+        return None
+
+    # Interned like course codes, so the name sets compared per course hash by identity
+    kelas = sys.intern(parts[0].strip().removeprefix("Kelas").strip())
+    return kelas, {
+        "waktu": parts[3].strip().lstrip("- "),
+        "ruang": parts[4].strip().lstrip("- "),
+        "dosen": parts[5].strip().lstrip("- ") if len(parts) > 5 else "-",
+    }
+
+
 def generate_diff(
     old: Dict[str, CourseInfo],
     new: Dict[str, CourseInfo],
@@ -58,23 +93,30 @@ def generate_diff(
     """
     changes: List[Change] = []
 
+    # Split course codes into new, removed and common in page order; no sorting needed
+    added_codes: List[str] = []
+    common_codes: List[str] = []
+    for code in new:
+        if code in old:
+            common_codes.append(code)
+        else:
+            added_codes.append(code)
+    removed_codes = [code for code in old if code not in new]
+
     # New courses
-    for code in sorted(new.keys() - old.keys()):
+    for code in added_codes:
         course_info = new[code]["info"]
         course_name = course_info.split(";")[0].strip()
 
         fields: List[ChangeField] = []
         for class_detail in new[code]["classes"]:
-            parts = class_detail.split(";")
-            if len(parts) >= 5:
-                kelas = parts[0].replace("Kelas", "").strip()
-                waktu = parts[3].strip().lstrip("- ")
-                ruang = parts[4].strip().lstrip("- ")
-                dosen = parts[5].strip().lstrip("- ") if len(parts) > 5 else "-"
+            parsed = _parse_class(class_detail)
+            if parsed is not None:
+                kelas, info = parsed
                 fields.append(
                     {
                         "name": kelas,
-                        "value": f"- {waktu}\n- {ruang}\n- {dosen}",
+                        "value": f"- {info['waktu']}\n- {info['ruang']}\n- {info['dosen']}",
                         "inline": False,
                     }
                 )
@@ -82,15 +124,21 @@ def generate_diff(
         changes.append({"type": "new", "title": course_name, "fields": fields})
 
     # Removed courses
-    for code in sorted(old.keys() - new.keys()):
+    for code in removed_codes:
         course_info = old[code]["info"]
         course_name = course_info.split(";")[0].strip()
         changes.append({"type": "removed", "title": course_name, "fields": []})
 
     # Modified courses
-    for code in sorted(old.keys() & new.keys()):
-        old_classes_dict = parse_classes_by_name(old[code]["classes"])
-        new_classes_dict = parse_classes_by_name(new[code]["classes"])
+    for code in common_codes:
+        # Most courses don't change between checks; skip them before parsing anything
+        if old[code]["classes"] == new[code]["classes"]:
+            continue
+
+        # Classes that are byte-identical at either end can't differ; only parse the rest
+        old_classes, new_classes = _trim_common_ends(old[code]["classes"], new[code]["classes"])
+        old_classes_dict = parse_classes_by_name(old_classes)
+        new_classes_dict = parse_classes_by_name(new_classes)
 
         old_names = set(old_classes_dict.keys())
         new_names = set(new_classes_dict.keys())
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import time
 from typing import List
 
@@ -7,7 +9,22 @@ from loguru import logger
 
 from fazuh.warlock.module.schedule.diff import Change
 
+# Embed color and title prefix for each change type
+_TYPE_META = {
+    "new": (0x57F287, "[NEW]"),  # Green
+    "removed": (0xED4245, "[REMOVED]"),  # Red
+    "modified": (0xFEE75C, "[EDITED]"),  # Yellow
+}
 
+# Discord limits per message: at most 10 embeds, 6000 characters across all of them
+_MAX_EMBEDS_PER_MESSAGE = 10
+_MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Attempts per chunk on transient errors, waiting 1s, 2s, ... between them
+_SEND_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=8)
 def _extract_period_from_url(url: str) -> str:
     """Extract period code from URL. Returns '2025-2' from '...?period=2025-2'"""
     if "period=" in url:
@@ -15,6 +32,7 @@ def _extract_period_from_url(url: str) -> str:
     return "Unknown"
 
 
+@functools.lru_cache(maxsize=8)
 def _format_period(period_code: str) -> str:
     """Convert period code to readable format. '2025-2' -> 'Semester Genap 2025/2026'"""
     if "-" not in period_code:
@@ -27,36 +45,47 @@ def _format_period(period_code: str) -> str:
     return f"Semester {semester_name} {year}/{next_year}"
 
 
+async def is_webhook_valid(url: str) -> bool:
+    """Checks that the Discord webhook URL points to an existing webhook."""
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.head(url) as resp:
+                return resp.status == 200
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
+
 async def send_notifications(
-    webhook_url: str, changes: List[Change], tracked_url: str, interval: int
-):
+    webhook_url: str,
+    changes: List[Change],
+    tracked_url: str,
+    interval: int,
+    session: aiohttp.ClientSession | None = None,
+) -> bool:
     """
     Sends the detected changes to the Discord webhook.
 
-    Uses embeds for small changes and a text file for large changes.
+    Each change becomes an embed; embeds are packed into as few messages as Discord allows.
 
     Args:
         webhook_url: The Discord webhook URL.
         changes: The list of change objects.
         tracked_url: The URL being tracked (for period extraction).
         interval: The check interval (for timestamp).
+        session: HTTP session to send through, so callers can keep connections alive across
+            notifications. A temporary one is opened if omitted.
+
+    Returns:
+        True if every change was delivered. Failed messages are retried a few times before
+        giving up, so False means some changes were dropped (and logged).
     """
     period_code = _extract_period_from_url(tracked_url)
     period_display = _format_period(period_code)
 
     embeds = []
     for change in changes:
-        if change["type"] == "new":
-            color = 0x57F287  # Green
-            title = f"[NEW] ﻿ ﻿ ﻿ {change['title']}"
-        elif change["type"] == "removed":
-            color = 0xED4245  # Red
-            title = f"[REMOVED] ﻿ ﻿ ﻿ {change['title']}"
-        else:  # modified
-            color = 0xFEE75C  # Yellow
-            title = f"[EDITED] ﻿ ﻿ ﻿ {change['title']}"
-
-        embed = discord.Embed(title=title, color=color)
+        color, prefix = _TYPE_META[change["type"]]
+        embed = discord.Embed(title=f"{prefix} ﻿ ﻿ ﻿ {change['title']}", color=color)
         for field in change["fields"]:
             embed.add_field(name=field["name"], value=field["value"], inline=field["inline"])
         embeds.append(embed)
@@ -66,36 +95,108 @@ async def send_notifications(
         f"Between <t:{int(time.time() - interval)}:R> to <t:{int(time.time())}:R>"
     )
 
-    # Chunk embeds (Discord allows max 10 embeds per webhook)
-    chunks = [embeds[i : i + 10] for i in range(0, len(embeds), 10)]
+    chunks = _chunk_embeds(embeds)
 
     if not chunks:
         logger.warning("No embeds to send.")
-        return
-
-    async with aiohttp.ClientSession() as session:
-        webhook = discord.Webhook.from_url(webhook_url, session=session)
-
-        try:
-            for i, chunk in enumerate(chunks):
-                kwargs = {
-                    "embeds": chunk,
-                    "username": "Warlock Tracker",
-                    "avatar_url": "https://academic.ui.ac.id/favicon.ico",
-                    "wait": True,
-                }
-
-                # Only include content (header) in the first message
-                if i == 0:
-                    kwargs["content"] = content
-
-                logger.debug(f"Sending chunk {i + 1}/{len(chunks)} with {len(chunk)} embeds.")
-                await webhook.send(**kwargs)
-                logger.info(f"Sent chunk {i + 1}/{len(chunks)} to webhook.")
-
-            logger.info("Changes sent to webhook successfully.")
-
-        except discord.HTTPException as e:
-            logger.error(f"Error sending to webhook: {e}")
-        except Exception as e:
-            logger.error(f"An unexpected error occurred: {e}")
+        return True
+
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await _send_chunks(session, webhook_url, chunks, content)
+    return await _send_chunks(session, webhook_url, chunks, content)
+
+
+async def _send_chunks(
+    session: aiohttp.ClientSession,
+    webhook_url: str,
+    chunks: List[List[discord.Embed]],
+    content: str,
+) -> bool:
+    """Sends chunks through one webhook in order, the header with the first delivered one.
+
+    Transient errors (server errors, rate limits, connection errors, timeouts) are retried
+    with backoff; if a chunk still fails, the remaining ones are not attempted. A chunk the
+    webhook rejects with any other client error can never succeed, so it is skipped.
+
+    Returns:
+        True if every chunk was delivered.
+    """
+    webhook = discord.Webhook.from_url(webhook_url, session=session)
+    header: str | None = content
+    delivered = True
+
+    # Chunks go out one at a time, so Discord shows them in order
+    for i in range(len(chunks)):
+        kwargs = {"content": header} if header is not None else {}
+        for attempt in range(_SEND_ATTEMPTS):
+            try:
+                await _send_chunk(webhook, chunks, i, **kwargs)
+                header = None
+                break
+            except (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                if not _is_transient(e):
+                    logger.error(f"Webhook rejected chunk {i + 1}/{len(chunks)}, dropping it: {e}")
+                    delivered = False
+                    break
+                if attempt + 1 == _SEND_ATTEMPTS:
+                    logger.error(
+                        f"Giving up on the webhook after {_SEND_ATTEMPTS} attempts; "
+                        f"{len(chunks) - i} chunk(s) not delivered: {e}"
+                    )
+                    return False
+                logger.warning(f"Error sending to webhook, retrying: {e}")
+                await asyncio.sleep(2**attempt)
+            except Exception as e:
+                logger.error(
+                    f"An unexpected error occurred, dropping chunk {i + 1}/{len(chunks)}: {e}"
+                )
+                delivered = False
+                break
+
+    if delivered:
+        logger.info("Changes sent to webhook successfully.")
+    return delivered
+
+
+def _is_transient(e: Exception) -> bool:
+    """Checks whether a failed webhook send may succeed if tried again."""
+    if isinstance(e, discord.HTTPException):
+        return e.status >= 500 or e.status == 429
+    return True
+
+
+def _chunk_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Greedily packs embeds, in order, into as few messages as Discord's limits allow."""
+    chunks: List[List[discord.Embed]] = []
+    chunk: List[discord.Embed] = []
+    size = 0
+    for embed in embeds:
+        embed_size = len(embed)
+        if chunk and (
+            len(chunk) == _MAX_EMBEDS_PER_MESSAGE
+            or size + embed_size > _MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(embed)
+        size += embed_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def _send_chunk(
+    webhook: discord.Webhook, chunks: List[List[discord.Embed]], i: int, **kwargs
+):
+    """Sends the i-th chunk of embeds to the webhook."""
+    chunk = chunks[i]
+    logger.debug(f"Sending chunk {i + 1}/{len(chunks)} with {len(chunk)} embeds.")
+    await webhook.send(
+        embeds=chunk,
+        username="Warlock Tracker",
+        avatar_url="https://academic.ui.ac.id/favicon.ico",
+        wait=True,
+        **kwargs,
+    )
+    logger.info(f"Sent chunk {i + 1}/{len(chunks)} to webhook.")
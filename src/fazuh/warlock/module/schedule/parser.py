@@ -1,7 +1,11 @@
+from io import BytesIO
+import sys
 from typing import Dict, List, TypedDict
 
-from bs4 import BeautifulSoup
-from bs4 import Tag
+from lxml import etree
+
+# Course headers are <th class="sub border2 pad2">
+_HEADER_CLASSES = frozenset(("sub", "border2", "pad2"))
 
 
 class CourseInfo(TypedDict):
@@ -19,45 +23,76 @@ def parse_schedule_html(html_content: str) -> Dict[str, CourseInfo]:
     Returns:
         A dictionary where keys are course codes and values contain info and list of class strings.
     """
-    soup = BeautifulSoup(html_content, "html.parser")
     result: Dict[str, CourseInfo] = {}
-
-    # every course starts with <th class="sub ...">
-    for hdr in soup.find_all("th", class_=("sub", "border2", "pad2")):
-        if hdr.parent is None:
+    if not html_content.strip():
+        return result
+
+    # Stream <tr> elements in document order instead of building the whole tree. Each row is
+    # freed once handled, so peak memory stays around one row. A row holding a course header
+    # (<th class="sub ...">) starts a course; the <tr> siblings after it are its classes.
+    # Parse from UTF-8 bytes so lxml accepts any page, including ones with an encoding declaration.
+    # Comments and processing instructions carry nothing we read, so they are never built.
+    rows = etree.iterparse(
+        BytesIO(html_content.encode("utf-8")),
+        events=("end",),
+        tag="tr",
+        html=True,
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+    )
+    current: List[List[str]] = []
+    current_table = None
+    for _, row in rows:
+        # Rows before this one are already handled; drop them to free memory
+        parent = row.getparent()
+        while row.getprevious() is not None:
+            del parent[0]
+
+        headers = [th for th in row.iter("th") if _is_course_header(th)]
+        if headers:
+            current = []
+            current_table = parent
+            for hdr in headers:
+                # 2a. course header; the <strong> wrapper is markup, so only its text is kept
+                course_line = _text(hdr)
+
+                # Extract course code (first part before the dash)
+                # Example: "CS123 - Intro to CS" -> "CS123"
+                # Interned so codes from the cached and freshly parsed schedule compare by identity
+                course_code = sys.intern(course_line.split("-")[0].strip())
+
+                classes_info: List[str] = []
+                result[course_code] = {"info": course_line, "classes": classes_info}
+                current.append(classes_info)
             continue
 
-        # 2a. course header
-        course_line = hdr.get_text(strip=True)
-        course_line = course_line.replace("<strong>", "").replace("</strong>", "")
+        # 2b. rows that belong to the current course are siblings of its header row
+        if not current or parent is not current_table:
+            continue
 
-        # Extract course code (first part before the dash)
-        # Example: "CS123 - Intro to CS" -> "CS123"
-        course_code = course_line.split("-")[0].strip()
+        # collect the text of every <td> in this <tr>
+        cells = [_text(td) for td in row.iter("td")]
+        if not cells:
+            continue
 
-        # 2b. collect all following <tr> rows that belong to this course
-        classes_info = []
-        for sibling in hdr.parent.find_next_siblings("tr"):
-            if not isinstance(sibling, Tag):
-                continue
+        # build one line per class, e.g.
+        # "Kelas Teori Matriks (A); Indonesia; 25/08/2025 - 19/12/2025; Rabu, 08.00-09.40; D.109; - Dra. ..."
+        class_line = "; ".join(cells[1:])  # skip the first cell (index number)
+        for classes_info in current:
+            classes_info.append(class_line)
 
-            # stop if we hit the next course header
-            if sibling.find("th", class_=("sub", "border2", "pad2")):
-                break
+    return result
 
-            # collect the text of every <td> in this <tr>
-            cells = [td.get_text(strip=True) for td in sibling.find_all("td")]
-            if not cells:
-                continue
 
-            # build one line per class, e.g.
-            # "Kelas Teori Matriks (A); Indonesia; 25/08/2025 - 19/12/2025; Rabu, 08.00-09.40; D.109; - Dra. ..."
-            class_line = "; ".join(cells[1:])  # skip the first cell (index number)
-            classes_info.append(class_line)
+def _is_course_header(th: etree._Element) -> bool:
+    """Checks whether a <th> has any of the course header classes."""
+    return not _HEADER_CLASSES.isdisjoint(th.get("class", "").split())
 
-        result[course_code] = {"info": course_line, "classes": classes_info}
 
-    return result
+def _text(el: etree._Element) -> str:
+    """Concatenates an element's stripped text nodes, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in el.itertext())
 
 
 def serialize_schedule(schedule: Dict[str, CourseInfo]) -> str:
@@ -91,13 +126,13 @@ def parse_schedule_string(content: str) -> Dict[str, CourseInfo]:
 
         if ": |" in line:
             course_info, classes_str = line.split(": |", 1)
-            course_code = course_info.split("-")[0].strip()
+            course_code = sys.intern(course_info.split("-")[0].strip())
             classes = [c.strip() for c in classes_str.split(" | ") if c.strip()]
             result[course_code] = {"info": course_info, "classes": classes}
         else:
             # Case where there are no classes, just the course info
             course_info = line.strip()
-            course_code = course_info.split("-")[0].strip()
+            course_code = sys.intern(course_info.split("-")[0].strip())
             result[course_code] = {"info": course_info, "classes": []}
 
     return result
@@ -1,11 +1,14 @@
 import asyncio
+import time
 from typing import Dict
 
+import aiohttp
 from loguru import logger
 
 from fazuh.warlock.config import Config
 from fazuh.warlock.module.schedule.cache import ScheduleCache
 from fazuh.warlock.module.schedule.diff import generate_diff
+from fazuh.warlock.module.schedule.notifier import is_webhook_valid
 from fazuh.warlock.module.schedule.notifier import send_notifications
 from fazuh.warlock.module.schedule.parser import CourseInfo
 from fazuh.warlock.module.schedule.parser import parse_schedule_html
@@ -24,28 +27,46 @@ class Track:
 
     def __init__(self):
         self.conf = Config()
-        self.conf.load()
 
         self.cache = ScheduleCache()
         self.siak = Siak(self.conf)
 
+        # Consecutive checks without changes, and the wait before the current check
+        self._idle_checks = 0
+        self._interval = self.conf.tracker_interval
+
         # Initialize state
         self._first_run_no_cache = not self.cache.exists()
         if self._first_run_no_cache:
             self.cache.touch()
-
-        self.prev_content = self.cache.read()
+            self.prev_content = ""
+        else:
+            self.prev_content = self.cache.read()
+        # Parsed form of prev_content, kept once known so updates don't re-parse the cache text
+        self._prev_courses: Dict[str, CourseInfo] | None = None
+        # Shared by all webhook notifications while the tracker runs
+        self._http: aiohttp.ClientSession | None = None
 
     async def start(self):
         """Starts the tracker loop.
 
         Continuously monitors the schedule at the configured interval.
         """
+        if not await is_webhook_valid(self.conf.tracker_discord_webhook_url):
+            logger.error("Invalid TRACKER_DISCORD_WEBHOOK_URL.")
+            return
+
         try:
+            # Chunks are sent one after another, so a single kept-alive socket carries a
+            # whole notification; cache DNS across checks.
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=3600, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
             await self.siak.start()
 
             while True:
-                self.conf.load()
+                started = time.monotonic()
                 try:
                     if not await self.siak.authenticate():
                         logger.error("Authentication failed.")
@@ -55,14 +76,21 @@ class Track:
                     logger.success("Schedule update tracker completed successfully.")
                 except Exception as e:
                     logger.error(f"An error occurred: {e}")
-
-                logger.info(
-                    f"Waiting for the next check in {self.conf.tracker_interval} seconds..."
-                )
-                await asyncio.sleep(self.conf.tracker_interval)
+                finally:
+                    # Pick up .env changes before the next check
+                    self.conf.load()
+
+                # Checks start every interval; time spent fetching counts towards the wait
+                self._interval = self._next_interval()
+                delay = max(0.0, self._interval - (time.monotonic() - started))
+                logger.info(f"Waiting for the next check in {delay:.0f} seconds...")
+                await asyncio.sleep(delay)
         finally:
             # Ensure we close browser if loop breaks
             await self.siak.close()
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
 
     async def run(self):
         """Executes a single check iteration.
@@ -82,14 +110,27 @@ class Track:
         # 3. Compare
         if self.prev_content == curr_str:
             logger.info("No updates detected.")
+            self._idle_checks += 1
+            return
+
+        if not self._first_run_no_cache and _same_lines(self.prev_content, curr_str):
+            # Save the new order so later checks take the fast path above
+            logger.info("No meaningful changes detected (only order changed).")
+            self._idle_checks += 1
+            await self._save_state(new_courses, curr_str)
             return
 
         # 4. Handle First Run or Update
         if self._first_run_no_cache:
-            await self._handle_first_run(curr_str)
+            await self._handle_first_run(new_courses, curr_str)
         else:
             await self._handle_update(new_courses, curr_str)
 
+    def _next_interval(self) -> int:
+        """Doubles the wait for every check without changes, up to TRACKER_MAX_INTERVAL."""
+        base = self.conf.tracker_interval
+        return min(base * 2 ** min(self._idle_checks, 16), self.conf.tracker_max_interval)
+
     async def _ensure_page(self) -> bool:
         """Navigates to the tracked URL if needed and verifies login."""
         if self.siak.page.url != self.conf.tracked_url:
@@ -100,19 +141,20 @@ class Track:
             return False
         return True
 
-    async def _handle_first_run(self, curr_str: str):
+    async def _handle_first_run(self, new_courses: Dict[str, CourseInfo], curr_str: str):
         """Handles the case where no cache existed previously."""
         logger.info("First run with no previous cache. Saving initial state without notification.")
-        self.prev_content = curr_str
-        await self.cache.write(curr_str)
+        await self._save_state(new_courses, curr_str)
         self._first_run_no_cache = False
 
     async def _handle_update(self, new_courses: Dict[str, CourseInfo], curr_str: str):
         """Handles the case where an update is detected."""
         logger.info("Update detected!")
 
-        # Parse old content for diffing
-        old_courses = parse_schedule_string(self.prev_content)
+        # Parse old content for diffing, unless it is still in memory from the last update
+        old_courses = self._prev_courses
+        if old_courses is None:
+            old_courses = self._prev_courses = parse_schedule_string(self.prev_content)
 
         # Generate diff
         changes = generate_diff(
@@ -123,19 +165,38 @@ class Track:
         )
 
         if not changes:
-            logger.info("No meaningful changes detected (only order changed).")
+            # Save anyway, so later checks don't diff the same suppressed changes again
+            logger.info("No changes to notify about (all suppressed or cosmetic).")
+            self._idle_checks += 1
+            await self._save_state(new_courses, curr_str)
             return
 
+        self._idle_checks = 0
+
         logger.debug(f"Changes: {changes}")
 
-        # Send notifications
-        await send_notifications(
+        # Send notifications. Failed messages are retried inside the call; the state advances
+        # either way, so the saved schedule always matches what was announced.
+        sent = await send_notifications(
             self.conf.tracker_discord_webhook_url,
             changes,
             self.conf.tracked_url,
-            self.conf.tracker_interval,
+            self._interval,
+            session=self._http,
         )
+        if not sent:
+            logger.warning("Some changes could not be delivered to the webhook.")
 
         # Update state
+        await self._save_state(new_courses, curr_str)
+
+    async def _save_state(self, new_courses: Dict[str, CourseInfo], curr_str: str):
+        """Makes the given schedule the one later checks compare against."""
         self.prev_content = curr_str
+        self._prev_courses = new_courses
         await self.cache.write(curr_str)
+
+
+def _same_lines(old: str, new: str) -> bool:
+    """Checks whether two serialized schedules hold the same lines in any order."""
+    return len(old) == len(new) and sorted(old.splitlines()) == sorted(new.splitlines())
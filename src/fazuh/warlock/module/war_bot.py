@@ -17,7 +17,6 @@ class WarBot:
 
     def __init__(self):
         self.conf = Config()
-        self.conf.load()
         self.siak = Siak(self.conf)
         self.irs_service = IrsService(self.siak)
         self.courses = load_courses()
@@ -34,20 +33,22 @@ class WarBot:
             await self.siak.start()
 
             while True:
-                self.conf.load()
                 try:
                     if not await self.siak.authenticate():
                         logger.error("Authentication failed.")
                         continue
 
                     if await self._run():
-                        # Keep browser open
-                        while True:
-                            await asyncio.sleep(1)
+                        # Keep browser open until the user closes it (or presses Ctrl+C)
+                        await self.siak.page.wait_for_event("close", timeout=0)
+                        return
 
                     await self.siak.unauthenticate()
                 except Exception as e:
                     logger.error(f"An error occurred: {e}")
+                finally:
+                    # Pick up .env changes before the next attempt
+                    self.conf.load()
 
                 logger.info(f"Retrying in {self.conf.warbot_interval} seconds...")
                 await asyncio.sleep(self.conf.warbot_interval)
@@ -68,5 +69,5 @@ class WarBot:
         await self.irs_service.submit_irs(self.conf.warbot_autosubmit)
 
         logger.success("WarBot completed successfully.")
-        logger.info("Script finished. Press Ctrl+C to exit (including the browser).")
+        logger.info("Script finished. Close the browser or press Ctrl+C to exit.")
         return True
@@ -74,9 +74,12 @@ class IrsService:
             if not pending_courses:
                 break
 
+            # Lowercase the row once rather than once per target
+            row_lc = {key: value.lower() for key, value in row_data.items()}
+
             # Iterate over a copy of the list so we can modify pending_courses safely
             for target in list(pending_courses):
-                if target.matches(row_data):
+                if target.matches(row_lc):
                     # Check the radio button using its value
                     await self.siak.page.check(f'input[type="radio"][value="{row_data["code"]}"]')
                     logger.info(f"Selected: {target} -> {row_data['name']}")
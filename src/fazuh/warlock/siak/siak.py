@@ -3,14 +3,21 @@ import base64
 from collections.abc import Iterable
 from typing import Any
 
+import httpx
 from loguru import logger
 from playwright.async_api import async_playwright
-import requests
+from playwright.async_api import Error as PlaywrightError
 
 from fazuh.warlock.bot import get_captcha_solution
 from fazuh.warlock.config import Config
 from fazuh.warlock.siak.path import Path
 
+_CAPTCHA_KEYWORDS = [
+    "This question is for testing whether you are a human visitor",
+    "What code is in the image?",
+    "You have entered an invalid answer",
+]
+
 
 class Siak:
     """Manages the browser session and interaction with SIAK NG.
@@ -264,19 +271,28 @@ class Siak:
                 "CAPTCHA detected. Please solve it manually in the opened browser window."
             )
 
-            # Poll until captcha is gone
-            while True:
-                try:
-                    # Check if answer input is still visible
-                    if not await self.page.is_visible("input[name=answer]"):
-                        # Double check content logic to be safe
-                        if not await self.is_captcha_page():
-                            logger.success("CAPTCHA passed.")
-                            break
-                except Exception:
-                    # Page possibly navigated away or closed
-                    break
-                await asyncio.sleep(1)
+            # Wait in the browser until the answer input is gone and the page text no longer
+            # looks like a CAPTCHA page. Unlike polling from Python, this survives navigations,
+            # and reading textContent avoids serializing the DOM on every poll.
+            try:
+                await self.page.wait_for_function(
+                    """(keywords) => {
+                        const input = document.querySelector("input[name=answer]");
+                        if (input && input.getClientRects().length > 0
+                            && getComputedStyle(input).visibility !== "hidden") {
+                            return false;
+                        }
+                        const text = document.body ? document.body.textContent : "";
+                        return !keywords.some((kw) => text.includes(kw));
+                    }""",
+                    arg=_CAPTCHA_KEYWORDS,
+                    polling=1000,
+                    timeout=0,
+                )
+                logger.success("CAPTCHA passed.")
+            except PlaywrightError:
+                # Page closed
+                pass
 
         except Exception as e:
             logger.error(f"Failed to handle CAPTCHA: {e}")
@@ -322,18 +338,29 @@ class Siak:
         """
         return not await self._check_page_content(["No role selected"], content)
 
+    async def wait_until_logged_in(self):
+        """Waits, without a timeout, until the page is logged in with a role selected.
+
+        Same checks as `is_logged_in_page` and `is_role_selected`, but evaluated in the browser
+        against the page text, so no HTML is serialized or pulled into Python on each poll.
+        Survives navigations.
+        """
+        await self.page.wait_for_function(
+            """() => {
+                const text = document.body ? document.body.textContent : "";
+                return text.includes("Logout Counter") && !text.includes("No role selected");
+            }""",
+            polling=1000,
+            timeout=0,
+        )
+
     async def is_captcha_page(self, content: str | None = None) -> bool:
         """Checks if the current page is a CAPTCHA challenge page.
 
         Args:
             content: Optional page content to check against.
         """
-        keywords = [
-            "This question is for testing whether you are a human visitor",
-            "What code is in the image?",
-            "You have entered an invalid answer",
-        ]
-        return await self._check_page_content(keywords, content)
+        return await self._check_page_content(_CAPTCHA_KEYWORDS, content)
 
     async def is_rejected_page(self, content: str | None = None) -> bool:
         """Checks if the request was rejected by the server.
@@ -404,14 +431,11 @@ class Siak:
         try:
             files = {"file": ("captcha.png", image_data, "image/png")}
             data = {"username": "Warlock Auth", "content": message}
-            response = await asyncio.to_thread(
-                requests.post,
-                self.config.auth_discord_webhook_url,
-                data=data,
-                files=files,
-                timeout=10,
-            )
+            async with httpx.AsyncClient(timeout=10) as client:
+                response = await client.post(
+                    self.config.auth_discord_webhook_url, data=data, files=files
+                )
             response.raise_for_status()
             logger.info("Admin notified about CAPTCHA and image sent.")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to notify admin via webhook: {e}")
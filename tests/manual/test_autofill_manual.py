@@ -1,5 +1,6 @@
 import pytest
 
+from fazuh.warlock.config import Config
 from fazuh.warlock.module.auto_fill import AutoFill
 from tests.libs.test_manager import MockManager
 
@@ -7,6 +8,7 @@ from tests.libs.test_manager import MockManager
 @pytest.mark.manual
 @pytest.mark.asyncio
 async def test_autofill_manual(schedule_html):
+    Config().load()
     autofill = AutoFill()
 
     await autofill.siak.start()
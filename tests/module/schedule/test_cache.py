@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from fazuh.warlock.module.schedule.cache import ScheduleCache
+
+
+def test_read_missing_file(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    assert cache.read() == ""
+
+
+@pytest.mark.asyncio
+async def test_read_reuses_unchanged_content(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    await cache.write("CS101 - Intro to CS")
+
+    assert cache.read() == "CS101 - Intro to CS"
+
+    with patch.object(type(cache.file_path), "read_text") as mock_read_text:
+        assert cache.read() == "CS101 - Intro to CS"
+        mock_read_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_picks_up_changes(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    await cache.write("CS101 - Intro to CS")
+    assert cache.read() == "CS101 - Intro to CS"
+
+    cache.file_path.write_text("CS102 - Data Structures", encoding="utf-8")
+    assert cache.read() == "CS102 - Data Structures"
+
+
+@pytest.mark.asyncio
+async def test_read_after_write_skips_disk(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    await cache.write("CS101 - Intro to CS")
+
+    with patch.object(type(cache.file_path), "read_text") as mock_read_text:
+        assert cache.read() == "CS101 - Intro to CS"
+        mock_read_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_write_replaces_file_atomically(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    await cache.write("CS101 - Intro to CS")
+    await cache.write("CS102 - Data Structures")
+
+    assert cache.file_path.read_text(encoding="utf-8") == "CS102 - Data Structures"
+    assert list(tmp_path.iterdir()) == [cache.file_path]
+
+
+@pytest.mark.asyncio
+async def test_write_skips_identical_content(tmp_path):
+    cache = ScheduleCache(tmp_path / "latest_courses.txt")
+    await cache.write("CS101 - Intro to CS")
+
+    with patch("fazuh.warlock.module.schedule.cache.os.replace") as mock_replace:
+        await cache.write("CS101 - Intro to CS")
+        mock_replace.assert_not_called()
@@ -1,4 +1,6 @@
+from fazuh.warlock.module.schedule.diff import _trim_common_ends
 from fazuh.warlock.module.schedule.diff import generate_diff
+from fazuh.warlock.module.schedule.diff import parse_classes_by_name
 
 
 def test_generate_diff_new_course():
@@ -99,3 +101,38 @@ def test_generate_diff_suppress_location():
     # With suppression
     changes = generate_diff(old, new, suppress_location=True)
     assert len(changes) == 0
+
+
+def test_parse_classes_by_name_is_memoized():
+    classes = ["Kelas A; English; Date; Senin 08.00; Room 1; Prof"]
+
+    first = parse_classes_by_name(classes)
+    assert first == {"A": {"waktu": "Senin 08.00", "ruang": "Room 1", "dosen": "Prof"}}
+    assert parse_classes_by_name(list(classes)) is first
+
+
+def test_generate_diff_follows_page_order():
+    old = {"CS200": {"info": "CS200 - Old", "classes": []}}
+    new = {
+        "CS300": {"info": "CS300 - Third", "classes": []},
+        "CS100": {"info": "CS100 - First", "classes": []},
+    }
+
+    changes = generate_diff(old, new)
+    assert [(c["type"], c["title"]) for c in changes] == [
+        ("new", "CS300 - Third"),
+        ("new", "CS100 - First"),
+        ("removed", "CS200 - Old"),
+    ]
+
+
+def test_trim_common_ends():
+    assert _trim_common_ends(["a", "b", "c"], ["a", "x", "c"]) == (["b"], ["x"])
+    assert _trim_common_ends(["a", "b"], ["a", "b", "c"]) == ([], ["c"])
+    assert _trim_common_ends(["a", "a"], ["a"]) == (["a"], [])
+    assert _trim_common_ends([], ["a"]) == ([], ["a"])
+
+
+def test_parse_classes_by_name_only_strips_leading_kelas():
+    parsed = parse_classes_by_name(["KelasKelas Khusus (A); Indonesia; Date; Time; Room; Prof"])
+    assert list(parsed) == ["Kelas Khusus (A)"]
@@ -1,8 +1,11 @@
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import discord
 import pytest
 
+from fazuh.warlock.module.schedule.notifier import _chunk_embeds
 from fazuh.warlock.module.schedule.notifier import _extract_period_from_url
 from fazuh.warlock.module.schedule.notifier import _format_period
 from fazuh.warlock.module.schedule.notifier import send_notifications
@@ -51,3 +54,151 @@ async def test_send_notifications():
             call_kwargs = mock_webhook.send.call_args.kwargs
             assert len(call_kwargs["embeds"]) == 1
             assert "Jadwal SIAK UI Berubah" in call_kwargs["content"]
+
+
+@pytest.mark.asyncio
+async def test_send_notifications_gives_up_after_retries():
+    changes = [{"type": "new", "title": "CS101", "fields": []}]
+
+    with patch("aiohttp.ClientSession") as mock_session_cls:
+        mock_session_cls.return_value.__aenter__.return_value = AsyncMock()
+
+        with patch("discord.Webhook.from_url") as mock_webhook_cls:
+            mock_webhook = AsyncMock()
+            mock_webhook.send.side_effect = discord.HTTPException(
+                MagicMock(status=503, reason="Service Unavailable"), "unavailable"
+            )
+            mock_webhook_cls.return_value = mock_webhook
+
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                sent = await send_notifications(
+                    webhook_url="http://webhook",
+                    changes=changes,
+                    tracked_url="http://url?period=2025-2",
+                    interval=60,
+                )
+
+    assert sent is False
+    assert mock_webhook.send.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+
+def test_chunk_embeds_respects_discord_limits():
+    small = [discord.Embed(title="x") for _ in range(12)]
+    assert [len(chunk) for chunk in _chunk_embeds(small)] == [10, 2]
+
+    large = [discord.Embed(title="t", description="d" * 2500) for _ in range(5)]
+    chunks = _chunk_embeds(large)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(sum(len(embed) for embed in chunk) <= 6000 for chunk in chunks)
+
+    assert _chunk_embeds([]) == []
+
+
+def test_period_helpers_are_memoized():
+    _format_period.cache_clear()
+    _format_period("2024-1")
+    _format_period("2024-1")
+    assert _format_period.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_send_notifications_reuses_given_session():
+    changes = [{"type": "removed", "title": "CS101", "fields": []}]
+    session = MagicMock()
+
+    with (
+        patch("aiohttp.ClientSession") as mock_session_cls,
+        patch("discord.Webhook.from_url") as mock_webhook_cls,
+    ):
+        mock_webhook_cls.return_value = AsyncMock()
+
+        sent = await send_notifications(
+            webhook_url="http://webhook",
+            changes=changes,
+            tracked_url="http://url?period=2025-2",
+            interval=60,
+            session=session,
+        )
+
+    assert sent is True
+    mock_session_cls.assert_not_called()
+    assert mock_webhook_cls.call_args.kwargs["session"] is session
+
+
+@pytest.mark.asyncio
+async def test_send_notifications_sends_chunks_in_order():
+    changes = [{"type": "new", "title": f"CS{i}", "fields": []} for i in range(25)]
+
+    with patch("discord.Webhook.from_url") as mock_webhook_cls:
+        mock_webhook = AsyncMock()
+        mock_webhook_cls.return_value = mock_webhook
+
+        await send_notifications(
+            webhook_url="http://webhook",
+            changes=changes,
+            tracked_url="http://url?period=2025-2",
+            interval=60,
+            session=MagicMock(),
+        )
+
+    calls = mock_webhook.send.call_args_list
+    titles = [embed.title for call in calls for embed in call.kwargs["embeds"]]
+    assert [len(call.kwargs["embeds"]) for call in calls] == [10, 10, 5]
+    assert titles == [f"[NEW] ﻿ ﻿ ﻿ CS{i}" for i in range(25)]
+    assert "content" in calls[0].kwargs
+    assert all("content" not in call.kwargs for call in calls[1:])
+
+
+def _http_error(status: int) -> discord.HTTPException:
+    return discord.HTTPException(MagicMock(status=status, reason="error"), "error")
+
+
+@pytest.mark.asyncio
+async def test_send_notifications_retries_transient_errors():
+    changes = [{"type": "new", "title": f"CS{i}", "fields": []} for i in range(25)]
+
+    with patch("discord.Webhook.from_url") as mock_webhook_cls:
+        mock_webhook = AsyncMock()
+        mock_webhook.send.side_effect = [None, _http_error(502), None, None]
+        mock_webhook_cls.return_value = mock_webhook
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            sent = await send_notifications(
+                webhook_url="http://webhook",
+                changes=changes,
+                tracked_url="http://url?period=2025-2",
+                interval=60,
+                session=MagicMock(),
+            )
+
+    assert sent is True
+    calls = mock_webhook.send.call_args_list
+    # The failed second chunk is sent again before the third
+    assert [len(call.kwargs["embeds"]) for call in calls] == [10, 10, 10, 5]
+    assert calls[1].kwargs["embeds"] == calls[2].kwargs["embeds"]
+
+
+@pytest.mark.asyncio
+async def test_send_notifications_drops_rejected_chunks():
+    changes = [{"type": "new", "title": f"CS{i}", "fields": []} for i in range(25)]
+
+    with patch("discord.Webhook.from_url") as mock_webhook_cls:
+        mock_webhook = AsyncMock()
+        mock_webhook.send.side_effect = [_http_error(400), None, None]
+        mock_webhook_cls.return_value = mock_webhook
+
+        sent = await send_notifications(
+            webhook_url="http://webhook",
+            changes=changes,
+            tracked_url="http://url?period=2025-2",
+            interval=60,
+            session=MagicMock(),
+        )
+
+    assert sent is False
+    calls = mock_webhook.send.call_args_list
+    assert len(calls) == 3
+    # The header moves to the first chunk that is actually delivered
+    assert "content" in calls[1].kwargs
+    assert "content" not in calls[2].kwargs
@@ -19,26 +19,53 @@ async def test_on_message_direct_reply():
         mock_user.return_value = mock_user_obj
 
         future = asyncio.Future()
-        bot.pending_captchas[555] = future
+        bot._current_future = future
+        bot._current_message_id = 555
 
         message = AsyncMock(spec=discord.Message)
         message.author.id = 111
         message.author.bot = False
         message.content = "123456"
+        message.channel.id = 123
         message.reference.message_id = 555
 
-        # Fix: Explicitly set fetch_message as an AsyncMock to avoid "AsyncMock can't be used in await" error
+        # get_partial_message is synchronous; only the reaction is awaited
         bot_message_mock = AsyncMock()
-        message.channel.fetch_message = AsyncMock(return_value=bot_message_mock)
+        message.channel.get_partial_message = MagicMock(return_value=bot_message_mock)
 
         await bot.on_message(message)
 
         assert future.done()
         assert future.result() == "123456"
 
+        await asyncio.sleep(0)
+        message.channel.get_partial_message.assert_called_once_with(555)
+        bot_message_mock.add_reaction.assert_awaited_once_with("✅")
+
 
 @pytest.mark.asyncio
-async def test_on_message_fallback_history_check():
+async def test_on_message_ignores_other_channels():
+    bot = CaptchaBot(channel_id=123)
+
+    future = asyncio.Future()
+    bot._current_future = future
+    bot._current_message_id = 555
+
+    message = AsyncMock(spec=discord.Message)
+    message.author.id = 111
+    message.author.bot = False
+    message.content = "123456"
+    message.channel.id = 456
+    message.reference.message_id = 555
+
+    await bot.on_message(message)
+
+    assert not future.done()
+    assert bot._last_message_id is None
+
+
+@pytest.mark.asyncio
+async def test_on_message_fallback_after_captcha():
     with patch("discord.Client.user", new_callable=PropertyMock) as mock_user:
         bot = CaptchaBot(channel_id=123)
         mock_user_obj = MagicMock()
@@ -46,8 +73,8 @@ async def test_on_message_fallback_history_check():
         mock_user.return_value = mock_user_obj
 
         future = asyncio.Future()
-        bot.pending_captchas[555] = future
-        bot.latest_captcha_message_id = 555
+        bot._current_future = future
+        bot._current_message_id = 555
 
         # Mock message (NOT a reply, but valid fallback)
         message = AsyncMock(spec=discord.Message)
@@ -57,24 +84,11 @@ async def test_on_message_fallback_history_check():
         message.channel.id = 123
         message.reference = None
 
-        # Fix: Explicitly set fetch_message as an AsyncMock
         bot_message_mock = AsyncMock()
-        message.channel.fetch_message = AsyncMock(return_value=bot_message_mock)
-
-        # Mock history
-        # history() returns an async iterator
-        # We need to mock the async iterator behavior
-
-        # Create mock messages for history
-        prev_msg = AsyncMock(spec=discord.Message)
-        prev_msg.id = 555  # Matches latest captcha
+        message.channel.get_partial_message = MagicMock(return_value=bot_message_mock)
 
-        # Mock the history method to return an async iterator
-        async def mock_history_gen(*args, **kwargs):
-            yield message  # Current message
-            yield prev_msg  # Previous message (captcha)
-
-        message.channel.history = mock_history_gen
+        # The CAPTCHA message was the last one seen in the channel
+        bot._last_message_id = 555
 
         await bot.on_message(message)
 
@@ -83,7 +97,7 @@ async def test_on_message_fallback_history_check():
 
 
 @pytest.mark.asyncio
-async def test_on_message_fallback_history_fail():
+async def test_on_message_fallback_not_after_captcha():
     with patch("discord.Client.user", new_callable=PropertyMock) as mock_user:
         bot = CaptchaBot(channel_id=123)
         mock_user_obj = MagicMock()
@@ -91,8 +105,8 @@ async def test_on_message_fallback_history_fail():
         mock_user.return_value = mock_user_obj
 
         future = asyncio.Future()
-        bot.pending_captchas[555] = future
-        bot.latest_captcha_message_id = 555
+        bot._current_future = future
+        bot._current_message_id = 555
 
         message = AsyncMock(spec=discord.Message)
         message.author.id = 111
@@ -101,16 +115,69 @@ async def test_on_message_fallback_history_fail():
         message.channel.id = 123
         message.reference = None
 
-        # Mock history where previous message is NOT the captcha
-        prev_msg = AsyncMock(spec=discord.Message)
-        prev_msg.id = 99999  # Some other message
+        # Some other message arrived after the CAPTCHA
+        bot._last_message_id = 99999
+
+        await bot.on_message(message)
+
+        assert not future.done()
 
-        async def mock_history_gen(*args, **kwargs):
-            yield message
-            yield prev_msg
 
-        message.channel.history = mock_history_gen
+@pytest.mark.asyncio
+async def test_on_message_fallback_uses_gateway_order():
+    with patch("discord.Client.user", new_callable=PropertyMock) as mock_user:
+        bot = CaptchaBot(channel_id=123)
+        mock_user_obj = MagicMock()
+        mock_user_obj.id = 999
+        mock_user.return_value = mock_user_obj
+
+        future = asyncio.Future()
+        bot._current_future = future
+        bot._current_message_id = 555
+        bot._user_id = 999
+
+        # The bot's own CAPTCHA message arrives through the gateway first
+        captcha_msg = AsyncMock(spec=discord.Message)
+        captcha_msg.id = 555
+        captcha_msg.author = mock_user_obj
+        captcha_msg.channel.id = 123
+        await bot.on_message(captcha_msg)
+
+        message = AsyncMock(spec=discord.Message)
+        message.id = 556
+        message.author.id = 111
+        message.author.bot = False
+        message.content = "ABCDEF"
+        message.channel.id = 123
+        message.reference = None
+        message.channel.get_partial_message = MagicMock(return_value=AsyncMock())
 
         await bot.on_message(message)
 
-        assert not future.done()
+        assert future.done()
+        assert future.result() == "ABCDEF"
+
+
+@pytest.mark.asyncio
+async def test_get_captcha_solution_when_login_fails():
+    from fazuh.warlock import bot as bot_module
+
+    bot = CaptchaBot(channel_id=123)
+    bot.solve = AsyncMock(return_value="ABCDEF")
+
+    async def failing_start():
+        raise discord.LoginFailure("Improper token has been passed.")
+
+    state = bot_module._BotState()
+    state.bot = bot
+    state.task = asyncio.create_task(failing_start())
+    state.task.add_done_callback(bot_module._on_bot_stopped)
+    state.attempted = True
+
+    with patch.object(bot_module, "_STATE", state):
+        solution = await asyncio.wait_for(bot_module.get_captcha_solution(b"png"), timeout=1)
+        await asyncio.sleep(0)
+
+        assert solution is None
+        assert state.bot is None
+        bot.solve.assert_not_awaited()
@@ -0,0 +1,99 @@
+from dataclasses import FrozenInstanceError
+import os
+
+import orjson
+import pytest
+
+from fazuh.warlock import model
+from fazuh.warlock.model import CourseTarget
+from fazuh.warlock.model import load_courses
+
+
+def test_load_courses_reuses_parsed_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+    (tmp_path / "courses.yaml").write_text(
+        "- course: Analisis 1\n  prof: Fake Prof\n- code: 782396\n"
+    )
+
+    first = load_courses()
+    assert first == [
+        CourseTarget(course="Analisis 1", prof="Fake Prof"),
+        CourseTarget(code="782396"),
+    ]
+
+    # Mutating the result must not leak into the cache
+    first.pop()
+
+    calls = []
+    original = model._parse_courses
+    monkeypatch.setattr(model, "_parse_courses", lambda path: calls.append(path) or original(path))
+
+    second = load_courses()
+    assert calls == []
+    assert len(second) == 2
+    assert second[0] is first[0]
+
+
+def test_load_courses_reparses_changed_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+    courses = tmp_path / "courses.json"
+    courses.write_text('{"Analisis 1": "Fake Prof"}')
+
+    assert load_courses() == [CourseTarget(course="Analisis 1", prof="Fake Prof")]
+
+    courses.write_text('[{"course": "AnDat Kategorik", "time": "Senin"}]')
+
+    assert load_courses() == [CourseTarget(course="AnDat Kategorik", time="Senin")]
+
+
+def test_load_courses_prefers_fresh_json_sidecar(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+    (tmp_path / "courses.yaml").write_text("- course: Analisis 1\n")
+
+    assert load_courses() == [CourseTarget(course="Analisis 1")]
+
+    sidecar = tmp_path / ".courses.yaml.json"
+    assert sidecar.exists()
+
+    # A sidecar recorded for the current YAML file is read instead of the YAML
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+    cached = orjson.loads(sidecar.read_bytes())
+    cached["data"] = [{"course": "From Sidecar"}]
+    sidecar.write_bytes(orjson.dumps(cached))
+
+    assert load_courses() == [CourseTarget(course="From Sidecar")]
+
+
+def test_load_courses_ignores_sidecar_for_restored_yaml(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+    yaml_path = tmp_path / "courses.yaml"
+    yaml_path.write_text("- course: Analisis 1\n")
+    load_courses()
+
+    # Replaced with an older mtime, as `cp -p`, `rsync -t` or unzip would do
+    sidecar_mtime = (tmp_path / ".courses.yaml.json").stat().st_mtime_ns
+    yaml_path.write_text("- course: Kalkulus 2\n")
+    os.utime(yaml_path, ns=(sidecar_mtime - 10**9, sidecar_mtime - 10**9))
+    monkeypatch.setattr(model, "_COURSE_CACHE", {})
+
+    assert load_courses() == [CourseTarget(course="Kalkulus 2")]
+
+
+def test_course_target_matches_lowercased_row():
+    row_lc = {"name": "analisis 1", "prof": "fake prof", "time": "senin, 08.00", "code": "782396"}
+
+    assert CourseTarget(course="Analisis", prof="FAKE", time="Senin").matches(row_lc)
+    assert CourseTarget(code="7823").matches(row_lc)
+    assert not CourseTarget(course="Analisis", prof="Other").matches(row_lc)
+    assert not CourseTarget(prof="Fake Prof").matches(row_lc)
+
+
+def test_course_target_is_immutable():
+    target = CourseTarget(course="Analisis 1")
+
+    with pytest.raises(FrozenInstanceError):
+        target.prof = "Fake Prof"
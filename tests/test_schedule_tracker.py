@@ -7,6 +7,7 @@ import pytest
 import pytest_asyncio
 
 from fazuh.warlock.module.schedule.cache import ScheduleCache
+from fazuh.warlock.module.schedule.parser import parse_schedule_string
 from fazuh.warlock.module.track import Track
 from fazuh.warlock.siak.siak import Siak
 
@@ -23,6 +24,45 @@ def mock_siak():
     return siak
 
 
+@pytest.fixture
+def cache_content() -> str | None:
+    """Schedule cache content before the tracker starts; None means no cache file.
+
+    Override per test with `@pytest.mark.parametrize("cache_content", [...])`.
+    """
+    return None
+
+
+@pytest.fixture
+def tracker(mock_siak, cache_content, tmp_path):
+    """A Track on mock_siak with a mocked Config and its cache file under tmp_path.
+
+    The patches stay active for the whole test, so tests can create more Track instances.
+    """
+    cache_file_path = tmp_path / "latest_courses.txt"
+    if cache_content is not None:
+        cache_file_path.write_text(cache_content)
+
+    with (
+        patch("fazuh.warlock.module.track.Config") as mock_config_cls,
+        patch(
+            "fazuh.warlock.module.track.ScheduleCache",
+            side_effect=lambda: ScheduleCache(file_path=cache_file_path),
+        ),
+    ):
+        mock_conf = mock_config_cls.return_value
+        mock_conf.tracked_url = mock_siak.page.url
+        mock_conf.tracker_discord_webhook_url = "http://mock-webhook"
+        mock_conf.tracker_interval = 60
+        mock_conf.tracker_max_interval = 60
+        mock_conf.tracker_suppress_professor_change = False
+        mock_conf.tracker_suppress_location_change = False
+
+        tracker = Track()
+        tracker.siak = mock_siak
+        yield tracker
+
+
 @pytest_asyncio.fixture
 async def schedule_html():
     path = Path(__file__).parent / "mock" / "schedule_page.html"
@@ -30,62 +70,121 @@ async def schedule_html():
 
 
 @pytest.mark.asyncio
-async def test_schedule_tracker_run(mock_siak, schedule_html, tmp_path):
+async def test_schedule_tracker_run(tracker, mock_siak, schedule_html):
     # Setup mock page content
     mock_siak.page.content = AsyncMock(return_value=schedule_html)
+    cache_file_path = tracker.cache.file_path
 
-    # Mock Config to avoid loading real .env
-    with patch("fazuh.warlock.module.track.Config") as mock_config_cls:
-        mock_conf = mock_config_cls.return_value
-        mock_conf.tracked_url = "https://academic.ui.ac.id/main/CoursePlan/CoursePlanView"
-        mock_conf.tracker_discord_webhook_url = "http://mock-webhook"
-        mock_conf.tracker_interval = 60
-        mock_conf.tracker_suppress_professor_change = False
-        mock_conf.tracker_suppress_location_change = False
+    # Mock send_notifications
+    with patch(
+        "fazuh.warlock.module.track.send_notifications",
+        new_callable=AsyncMock,
+        return_value=True,
+    ) as mock_send:
+        # First run - should save cache and NOT notify
+        await tracker.run()
+        assert mock_send.call_count == 0
 
-        # Patch ScheduleCache to use tmp_path
-        cache_file_path = tmp_path / "latest_courses.txt"
+        # Modify cache to simulate a change
+        original_content = cache_file_path.read_text()
 
-        def mock_cache_init(*args, **kwargs):
-            return ScheduleCache(file_path=cache_file_path)
+        # Remove one line from cache to simulate it being "added" in the next run
+        lines = original_content.splitlines()
+        # We need to be careful what we remove. The cache format is "Course: | Class"
+        # Let's remove the first course entry
+        lines.pop(0)
+        cache_file_path.write_text("\n".join(lines))
 
-        with patch(
-            "fazuh.warlock.module.track.ScheduleCache",
-            side_effect=mock_cache_init,
-        ):
-            # Mock send_notifications
-            with patch(
-                "fazuh.warlock.module.track.send_notifications",
-                new_callable=AsyncMock,
-            ) as mock_send:
-                tracker = Track()
-                tracker.siak = mock_siak
-
-                # First run - should save cache and NOT notify
-                await tracker.run()
-                assert mock_send.call_count == 0
-
-                # Modify cache to simulate a change
-                original_content = cache_file_path.read_text()
-
-                # Remove one line from cache to simulate it being "added" in the next run
-                lines = original_content.splitlines()
-                # We need to be careful what we remove. The cache format is "Course: | Class"
-                # Let's remove the first course entry
-                lines.pop(0)
-                cache_file_path.write_text("\n".join(lines))
-
-                # Re-init tracker to load modified cache
-                tracker = Track()
-                tracker.siak = mock_siak
-                tracker.conf = mock_conf  # Ensure config is set
-
-                # Second run - should detect update and notify
-                await tracker.run()
-
-                assert mock_send.called
-                args = mock_send.call_args[0]
-                assert args[0] == "http://mock-webhook"
-                changes = args[1]
-                # Verify that some change was detected (should show the added course)
-                assert any(change["type"] == "new" for change in changes)
+        # Re-init tracker to load modified cache
+        tracker = Track()
+        tracker.siak = mock_siak
+
+        # Second run - should detect update and notify
+        await tracker.run()
+
+        assert mock_send.called
+        args = mock_send.call_args[0]
+        assert args[0] == "http://mock-webhook"
+        changes = args[1]
+        # Verify that some change was detected (should show the added course)
+        assert any(change["type"] == "new" for change in changes)
+
+
+def test_next_interval_backs_off_while_idle(tracker):
+    tracker.conf.tracker_max_interval = 300
+
+    assert tracker._next_interval() == 60
+    tracker._idle_checks = 1
+    assert tracker._next_interval() == 120
+    tracker._idle_checks = 3
+    assert tracker._next_interval() == 300
+
+    # No backoff when the maximum equals the base interval
+    tracker.conf.tracker_max_interval = 60
+    assert tracker._next_interval() == 60
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_content", ["CS101 - Old: | Class A"])
+async def test_failed_notification_still_saves_state(tracker):
+    change = {"type": "new", "title": "CS102", "fields": []}
+    with (
+        patch("fazuh.warlock.module.track.generate_diff", return_value=[change]) as mock_diff,
+        patch(
+            "fazuh.warlock.module.track.send_notifications",
+            new_callable=AsyncMock,
+            return_value=False,
+        ),
+    ):
+        # Retries happen inside send_notifications; the tracker moves on regardless
+        await tracker._handle_update({}, "CS102 - New: | Class A")
+        assert tracker.prev_content == "CS102 - New: | Class A"
+        assert tracker.cache.file_path.read_text() == "CS102 - New: | Class A"
+
+        # The next diff starts from the schedule kept in memory, not the cache text
+        new_courses = {"CS103": {"info": "CS103 - Newer", "classes": []}}
+        await tracker._handle_update(new_courses, "CS103 - Newer")
+        assert mock_diff.call_args[0][0] == {}
+        assert tracker._prev_courses is new_courses
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_content", ["CS101 - A: | Class A\nCS102 - B: | Class B"])
+async def test_reordered_schedule_is_saved_without_diffing(tracker, mock_siak):
+    html = """
+    <table>
+        <tr><th class="sub border2 pad2">CS102 - B</th></tr>
+        <tr><td>1</td><td>Class B</td></tr>
+        <tr><th class="sub border2 pad2">CS101 - A</th></tr>
+        <tr><td>1</td><td>Class A</td></tr>
+    </table>
+    """
+    mock_siak.page.content = AsyncMock(return_value=html)
+
+    with patch("fazuh.warlock.module.track.generate_diff") as mock_diff:
+        await tracker.run()
+
+    mock_diff.assert_not_called()
+    assert tracker.cache.file_path.read_text() == "CS102 - B: | Class B\nCS101 - A: | Class A"
+    assert tracker._idle_checks == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cache_content", ["CS101 - A: | Kelas A; Indonesia; Date; Time; Room; - Dr. Old"]
+)
+async def test_suppressed_changes_are_saved_and_keep_backoff(tracker):
+    tracker.conf.tracker_max_interval = 960
+    tracker.conf.tracker_suppress_professor_change = True
+    tracker._idle_checks = 4
+
+    curr_str = "CS101 - A: | Kelas A; Indonesia; Date; Time; Room; - Dr. New"
+    with patch(
+        "fazuh.warlock.module.track.send_notifications", new_callable=AsyncMock
+    ) as mock_send:
+        await tracker._handle_update(parse_schedule_string(curr_str), curr_str)
+
+    mock_send.assert_not_called()
+    assert tracker.cache.file_path.read_text() == curr_str
+    assert tracker._idle_checks == 5
+    assert tracker._next_interval() == 960
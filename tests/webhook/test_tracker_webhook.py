@@ -1,6 +1,7 @@
 from loguru import logger
 import pytest
 
+from fazuh.warlock.config import Config
 from fazuh.warlock.module.schedule.diff import generate_diff
 from fazuh.warlock.module.schedule.notifier import send_notifications
 from fazuh.warlock.module.schedule.parser import parse_schedule_string
@@ -11,6 +12,7 @@ from fazuh.warlock.module.track import Track
 @pytest.mark.asyncio
 async def test_tracker_simulation():
     """Simulate changes for all course modification cases and output to terminal."""
+    Config().load()
     tracker = Track()
     logger.info("Test mode enabled. Simulating schedule updates...")
 